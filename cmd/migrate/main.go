@@ -5,8 +5,11 @@ package main
 import (
 	"context"
 	"encoding/json"
+	"errors"
 	"flag"
 	"fmt"
+	"io"
+	"io/fs"
 	"log"
 	"os"
 	"path/filepath"
@@ -20,6 +23,8 @@ import (
 
 const (
 	batchSize           = 100
+	exportFormatJSON    = "json"
+	exportFormatNDJSON  = "ndjson"
 	migrationVersion    = "1.0.0"
 	backupDirPermission = 0o755
 )
@@ -43,6 +48,7 @@ type MigrationTool struct {
 	dryRun       bool
 	validateOnly bool
 	isJSONExport bool
+	exportFormat string
 	stats        *MigrationStats
 }
 
@@ -50,6 +56,7 @@ func main() {
 	var (
 		chromaDBPath = flag.String("chroma-path", "", "Path to ChromaDB data directory")
 		chromaExport = flag.String("chroma-export", "", "Path to ChromaDB JSON export file")
+		exportFormat = flag.String("export-format", exportFormatJSON, "Format of the -chroma-export file (json or ndjson)")
 		_            = flag.String("config", "configs/dev/config.yaml", "Path to configuration file (unused - uses env vars)")
 		backupDir    = flag.String("backup-dir", "./migration-backup", "Directory for migration backups")
 		dryRun       = flag.Bool("dry-run", false, "Perform dry run without writing to Qdrant")
@@ -71,6 +78,18 @@ func main() {
 		os.Exit(1)
 	}
 
+	if *exportFormat != exportFormatJSON && *exportFormat != exportFormatNDJSON {
+		fmt.Fprintf(os.Stderr, "Error: -export-format must be %q or %q\n", exportFormatJSON, exportFormatNDJSON)
+		flag.Usage()
+		os.Exit(1)
+	}
+
+	if *exportFormat != exportFormatJSON && *chromaExport == "" {
+		fmt.Fprintf(os.Stderr, "Error: -export-format requires -chroma-export\n")
+		flag.Usage()
+		os.Exit(1)
+	}
+
 	// Setup logging (simple approach for migration tool)
 	if *verbose {
 		log.SetFlags(log.LstdFlags | log.Lshortfile)
@@ -93,7 +112,7 @@ func main() {
 	}
 
 	// Create migration tool
-	migrator, err := NewMigrationTool(inputPath, cfg, *backupDir, *dryRun, *validateOnly, *chromaExport != "")
+	migrator, err := NewMigrationTool(inputPath, cfg, *backupDir, *dryRun, *validateOnly, *chromaExport != "", *exportFormat)
 	if err != nil {
 		log.Fatalf("Failed to create migration tool: %v", err)
 	}
@@ -108,7 +127,7 @@ func main() {
 }
 
 // NewMigrationTool creates a new migration tool instance
-func NewMigrationTool(inputPath string, cfg *config.Config, backupDir string, dryRun, validateOnly, isJSONExport bool) (*MigrationTool, error) {
+func NewMigrationTool(inputPath string, cfg *config.Config, backupDir string, dryRun, validateOnly, isJSONExport bool, exportFormat string) (*MigrationTool, error) {
 	// Create Qdrant store
 	qdrantStore := storage.NewQdrantStore(&cfg.Qdrant)
 
@@ -124,6 +143,7 @@ func NewMigrationTool(inputPath string, cfg *config.Config, backupDir string, dr
 		dryRun:       dryRun,
 		validateOnly: validateOnly,
 		isJSONExport: isJSONExport,
+		exportFormat: exportFormat,
 		stats: &MigrationStats{
 			StartTime: time.Now(),
 		},
@@ -214,6 +234,9 @@ func (mt *MigrationTool) executeMigration(ctx context.Context, chunks []types.Co
 // readChromaDBData reads all chunks from ChromaDB or JSON export
 func (mt *MigrationTool) readChromaDBData(ctx context.Context) ([]types.ConversationChunk, error) {
 	if mt.isJSONExport {
+		if mt.exportFormat == exportFormatNDJSON {
+			return mt.readNDJSONExport()
+		}
 		return mt.readJSONExport()
 	}
 	return mt.readDirectChromaDB(ctx)
@@ -243,15 +266,91 @@ func (mt *MigrationTool) readJSONExport() ([]types.ConversationChunk, error) {
 		return nil, fmt.Errorf("failed to decode JSON export: %w", err)
 	}
 
+	if exportData.Chunks == nil {
+		return nil, errors.New("JSON export has no \"chunks\" array (use -export-format=ndjson for NDJSON exports)")
+	}
+	if len(exportData.Chunks) == 0 {
+		return nil, errors.New("JSON export contains no chunks")
+	}
+
 	log.Printf("Loaded chunks from JSON export: count=%d", len(exportData.Chunks))
 
-	if exportData.Metadata != nil {
-		if stats, ok := exportData.Metadata["stats"].(map[string]interface{}); ok {
-			log.Printf("Export metadata: original_stats=%v", stats)
+	logExportStats(exportData.Metadata)
+
+	return exportData.Chunks, nil
+}
+
+// readNDJSONExport reads chunks from a newline-delimited JSON export file,
+// one chunk per line, with export metadata in an optional <path>.meta.json sidecar
+func (mt *MigrationTool) readNDJSONExport() ([]types.ConversationChunk, error) {
+	log.Printf("Reading NDJSON export: path=%s", mt.inputPath)
+
+	file, err := os.Open(mt.inputPath)
+	if err != nil {
+		return nil, fmt.Errorf("failed to open NDJSON export file: %w", err)
+	}
+	defer func() {
+		if closeErr := file.Close(); closeErr != nil {
+			log.Printf("Failed to close file: %v", closeErr)
 		}
+	}()
+
+	// json.Decoder is used rather than bufio.Scanner because lines carrying
+	// large embeddings can exceed the scanner's default token size
+	var chunks []types.ConversationChunk
+	decoder := json.NewDecoder(file)
+	for {
+		var chunk types.ConversationChunk
+		err := decoder.Decode(&chunk)
+		if errors.Is(err, io.EOF) {
+			break
+		}
+		if err != nil {
+			return nil, fmt.Errorf("failed to decode NDJSON chunk %d: %w", len(chunks)+1, err)
+		}
+		if chunk.ID == "" {
+			return nil, fmt.Errorf("NDJSON chunk %d has no id (is -export-format correct?)", len(chunks)+1)
+		}
+		chunks = append(chunks, chunk)
 	}
 
-	return exportData.Chunks, nil
+	if len(chunks) == 0 {
+		return nil, errors.New("NDJSON export contains no chunks")
+	}
+
+	log.Printf("Loaded chunks from NDJSON export: count=%d", len(chunks))
+
+	metaPath := mt.inputPath + ".meta.json"
+	metadata, err := readExportMetadata(metaPath)
+	switch {
+	case err == nil:
+		logExportStats(metadata)
+	case !errors.Is(err, fs.ErrNotExist):
+		log.Printf("Failed to read export metadata: path=%s, error=%v", metaPath, err)
+	}
+
+	return chunks, nil
+}
+
+// readExportMetadata reads an NDJSON export's metadata sidecar
+func readExportMetadata(path string) (map[string]interface{}, error) {
+	data, err := os.ReadFile(path) // #nosec G304 -- path derived from user-provided export path
+	if err != nil {
+		return nil, err
+	}
+
+	var metadata map[string]interface{}
+	if err := json.Unmarshal(data, &metadata); err != nil {
+		return nil, fmt.Errorf("failed to decode export metadata: %w", err)
+	}
+	return metadata, nil
+}
+
+// logExportStats logs the original exporter stats recorded in export metadata, if any
+func logExportStats(metadata map[string]interface{}) {
+	if stats, ok := metadata["stats"].(map[string]interface{}); ok {
+		log.Printf("Export metadata: original_stats=%v", stats)
+	}
 }
 
 // readDirectChromaDB reads data directly from ChromaDB
@@ -277,6 +376,7 @@ func (mt *MigrationTool) readDirectChromaDB(ctx context.Context) ([]types.Conver
 	log.Printf("RECOMMENDED: Use the JSON export approach instead:")
 	log.Printf("1. Run: python scripts/export_chromadb.py /path/to/chromadb")
 	log.Printf("2. Then: go run cmd/migrate/main.go -chroma-export=chromadb_export.json")
+	log.Printf("   (for NDJSON exports: -chroma-export=chromadb_export.ndjson -export-format=ndjson)")
 
 	return []types.ConversationChunk{}, nil
 }
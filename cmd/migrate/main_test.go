@@ -0,0 +1,147 @@
+package main
+
+import (
+	"io/fs"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func writeExportFile(t *testing.T, name, content string) string {
+	t.Helper()
+	path := filepath.Join(t.TempDir(), name)
+	require.NoError(t, os.WriteFile(path, []byte(content), 0o600))
+	return path
+}
+
+func TestReadNDJSONExport(t *testing.T) {
+	tests := []struct {
+		name        string
+		content     string
+		wantIDs     []string
+		errContains string
+	}{
+		{
+			name:    "multiple lines with blank trailing line",
+			content: "{\"id\":\"a\",\"content\":\"first\"}\n{\"id\":\"b\",\"content\":\"second\"}\n{\"id\":\"c\",\"embeddings\":[0.1,0.2]}\n\n",
+			wantIDs: []string{"a", "b", "c"},
+		},
+		{
+			name:        "empty file",
+			content:     "",
+			errContains: "NDJSON export contains no chunks",
+		},
+		{
+			name:        "blank lines only",
+			content:     "\n\n",
+			errContains: "NDJSON export contains no chunks",
+		},
+		{
+			name:        "stray closing brace line",
+			content:     "{\"id\":\"a\"}\n}\n{\"id\":\"b\"}\n",
+			errContains: "NDJSON chunk 2",
+		},
+		{
+			name:        "stray closing bracket line",
+			content:     "{\"id\":\"a\"}\n]\n",
+			errContains: "NDJSON chunk 2",
+		},
+		{
+			name:        "malformed line",
+			content:     "{\"id\":\"a\"}\n{\"id\":\"b\",\n",
+			errContains: "NDJSON chunk 2",
+		},
+		{
+			name:        "chunk without id",
+			content:     "{\"id\":\"a\"}\n{\"content\":\"orphan\"}\n",
+			errContains: "NDJSON chunk 2 has no id",
+		},
+		{
+			name:        "regular JSON export",
+			content:     "{\"chunks\":[{\"id\":\"a\"}],\"metadata\":{\"stats\":{\"total\":1}}}\n",
+			errContains: "NDJSON chunk 1 has no id",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mt := &MigrationTool{inputPath: writeExportFile(t, "export.ndjson", tt.content)}
+
+			chunks, err := mt.readNDJSONExport()
+			if tt.errContains != "" {
+				require.Error(t, err)
+				assert.Contains(t, err.Error(), tt.errContains)
+				return
+			}
+
+			require.NoError(t, err)
+			require.Len(t, chunks, len(tt.wantIDs))
+			for i, wantID := range tt.wantIDs {
+				assert.Equal(t, wantID, chunks[i].ID)
+			}
+		})
+	}
+}
+
+func TestReadExportMetadata(t *testing.T) {
+	dir := t.TempDir()
+
+	_, err := readExportMetadata(filepath.Join(dir, "missing.meta.json"))
+	require.ErrorIs(t, err, fs.ErrNotExist)
+
+	validPath := filepath.Join(dir, "valid.meta.json")
+	require.NoError(t, os.WriteFile(validPath, []byte(`{"stats":{"total_documents":1}}`), 0o600))
+	metadata, err := readExportMetadata(validPath)
+	require.NoError(t, err)
+	assert.Contains(t, metadata, "stats")
+
+	corruptPath := filepath.Join(dir, "corrupt.meta.json")
+	require.NoError(t, os.WriteFile(corruptPath, []byte(`{"stats":`), 0o600))
+	_, err = readExportMetadata(corruptPath)
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "failed to decode export metadata")
+}
+
+func TestReadJSONExport(t *testing.T) {
+	tests := []struct {
+		name        string
+		content     string
+		wantCount   int
+		errContains string
+	}{
+		{
+			name:      "regular JSON export",
+			content:   `{"chunks":[{"id":"a"},{"id":"b"}],"metadata":{"stats":{"total":2}}}`,
+			wantCount: 2,
+		},
+		{
+			name:        "empty chunks array",
+			content:     `{"chunks":[],"metadata":{}}`,
+			errContains: "JSON export contains no chunks",
+		},
+		{
+			name:        "NDJSON export",
+			content:     "{\"id\":\"a\"}\n{\"id\":\"b\"}\n",
+			errContains: "-export-format=ndjson",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mt := &MigrationTool{inputPath: writeExportFile(t, "export.json", tt.content)}
+
+			chunks, err := mt.readJSONExport()
+			if tt.errContains != "" {
+				require.Error(t, err)
+				assert.Contains(t, err.Error(), tt.errContains)
+				return
+			}
+
+			require.NoError(t, err)
+			assert.Len(t, chunks, tt.wantCount)
+		})
+	}
+}